@@ -7,9 +7,19 @@ import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from httpx import Client
+
 from toggl_api.config import AuthenticationError, generate_authentication
 
-from .utils import _client_cleanup, _org_cleanup, _path_cleanup, _project_cleanup, _tag_cleanup, _tracker_cleanup
+from .utils import (
+    Throttle,
+    _client_cleanup,
+    _org_cleanup,
+    _path_cleanup,
+    _project_cleanup,
+    _tag_cleanup,
+    _tracker_cleanup,
+)
 
 if TYPE_CHECKING:
     from httpx import BasicAuth
@@ -18,47 +28,53 @@ log = logging.getLogger("toggl-api-wrapper.scripts")
 
 
 DEFAULT_OBJECT: frozenset[str] = frozenset({"tracker", "project", "tag", "client", "org"})
+_CONFIRM: frozenset[str] = frozenset({"y"})
+_CANCEL: frozenset[str] = frozenset({"n"})
 
 
-def _target_objects() -> set[str]:
+def _generate_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("-o", "--objects", nargs="+", help="Which objects not to parse.")
+    return parser
 
-    args = parser.parse_args().objects
-    targets = set(DEFAULT_OBJECT)
-    if args is None:
-        return targets
-
-    targets.difference_update(args)
 
-    return targets
+def _target_objects(args: argparse.Namespace) -> frozenset[str]:
+    if args.objects is None:
+        return DEFAULT_OBJECT
+    return DEFAULT_OBJECT.difference(args.objects)
 
 
-def _clean(args: set[str], auth: BasicAuth, workspace: int) -> None:
+def _clean(args: frozenset[str], auth: BasicAuth, workspace: int) -> None:
     cache_loc = Path() / "cache"
 
+    with Client() as client:
+        _clean_models(args, auth, workspace, client)
+
+    log.info("Cleaning cache...")
+    _path_cleanup(cache_loc)
+
+
+def _clean_models(args: frozenset[str], auth: BasicAuth, workspace: int, client: Client) -> None:
+    throttle = Throttle(1)
     if "tracker" in args:
         log.info("Cleaning trackers...")
-        _tracker_cleanup(workspace, auth, 1)
+        _tracker_cleanup(workspace, auth, 1, client=client, throttle=throttle)
 
     if "project" in args:
         log.info("Cleaning projects...")
-        _project_cleanup(workspace, auth, 1)
+        _project_cleanup(workspace, auth, 1, client=client, throttle=throttle)
 
     if "tag" in args:
         log.info("Cleaning tags...")
-        _tag_cleanup(workspace, auth, 1)
+        _tag_cleanup(workspace, auth, 1, client=client, throttle=throttle)
 
     if "client" in args:
         log.info("Cleaning clients...")
-        _client_cleanup(workspace, auth, 1)
+        _client_cleanup(workspace, auth, 1, client=client, throttle=throttle)
 
     if "org" in args:
         log.info("Cleaning organizations...")
-        _org_cleanup(auth, 1)
-
-    log.info("Cleaning cache...")
-    _path_cleanup(cache_loc)
+        _org_cleanup(auth, 1, client=client, throttle=throttle)
 
 
 def main() -> None:
@@ -72,7 +88,7 @@ def main() -> None:
     logging.basicConfig(encoding="utf-8", level=logging.INFO, format=fmt)
     log.info("Starting to clean toggl-account!")
 
-    args = _target_objects()
+    args = _target_objects(_generate_parser().parse_args())
 
     try:
         auth = generate_authentication()
@@ -87,11 +103,11 @@ def main() -> None:
 
     while True:
         print(f"Are you sure you want to remove all {', '.join(args)} models?")  # noqa: T201
-        choice = input("[y/N] > ")
-        if choice.lower() == "n":
+        choice = input("[y/N] > ").lower()
+        if choice in _CANCEL:
             log.info("Exiting...")
             sys.exit(1)
-        elif choice.lower() == "y":
+        if choice in _CONFIRM:
             break
 
     _clean(args, auth, workspace)
@@ -4,7 +4,7 @@ import os
 import time
 from pathlib import Path
 
-from httpx import BasicAuth, HTTPError
+from httpx import BasicAuth, Client, HTTPError
 
 from toggl_api import ClientEndpoint, OrganizationEndpoint, ProjectEndpoint, TagEndpoint, TrackerEndpoint
 from toggl_api.config import generate_authentication
@@ -13,67 +13,132 @@ log = logging.getLogger("toggl-api-wrapper.scripts")
 
 
 def _path_cleanup(cache_path: Path) -> None:
-    for file in cache_path.rglob("*"):
-        if file.is_dir():
-            _path_cleanup(cache_path)
-            continue
-        file.unlink()
-    cache_path.rmdir()
-
-
-def _tracker_cleanup(wid: int, config: BasicAuth, delay: int = 1) -> None:
-    endpoint = TrackerEndpoint(wid, config)
+    # NOTE: Walks bottom up so directories are already empty when removed.
+    for root, dirs, files in os.walk(cache_path, topdown=False):
+        for file in files:
+            os.unlink(os.path.join(root, file))  # noqa: PTH108, PTH118
+        for directory in dirs:
+            os.rmdir(os.path.join(root, directory))  # noqa: PTH106, PTH118
+    if cache_path.exists():
+        cache_path.rmdir()
+
+
+class Throttle:
+    """Spaces out calls by at least `delay` seconds including the call itself."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.next_call = 0.0
+
+    def wait(self) -> None:
+        now = time.monotonic()
+        if self.next_call > now:
+            time.sleep(self.next_call - now)
+            now = self.next_call
+        self.next_call = now + self.delay
+
+
+def _tracker_cleanup(
+    wid: int,
+    config: BasicAuth,
+    delay: int = 1,
+    *,
+    client: Client | None = None,
+    throttle: Throttle | None = None,
+) -> None:
+    endpoint = TrackerEndpoint(wid, config, client=client)
+    throttle = throttle or Throttle(delay)
+    throttle.wait()
     for tracker in endpoint.collect(refresh=True):
         log.info("Deleting tracker: %s", tracker)
+        throttle.wait()
         with contextlib.suppress(HTTPError):
             endpoint.delete(tracker)
-        time.sleep(delay)
 
 
-def _project_cleanup(wid: int, config: BasicAuth, delay: int = 1) -> None:
-    endpoint = ProjectEndpoint(wid, config)
+def _project_cleanup(
+    wid: int,
+    config: BasicAuth,
+    delay: int = 1,
+    *,
+    client: Client | None = None,
+    throttle: Throttle | None = None,
+) -> None:
+    endpoint = ProjectEndpoint(wid, config, client=client)
+    throttle = throttle or Throttle(delay)
+    throttle.wait()
     for project in endpoint.collect(refresh=True):
         log.info("Deleting tracker: %s", project)
+        throttle.wait()
         with contextlib.suppress(HTTPError):
             endpoint.delete(project)
-        time.sleep(delay)
 
 
-def _client_cleanup(wid: int, config: BasicAuth, delay: int = 1) -> None:
-    endpoint = ClientEndpoint(wid, config)
-    for client in endpoint.collect(refresh=True):
-        log.info("Deleting client: %s", client)
+def _client_cleanup(
+    wid: int,
+    config: BasicAuth,
+    delay: int = 1,
+    *,
+    client: Client | None = None,
+    throttle: Throttle | None = None,
+) -> None:
+    endpoint = ClientEndpoint(wid, config, client=client)
+    throttle = throttle or Throttle(delay)
+    throttle.wait()
+    for toggl_client in endpoint.collect(refresh=True):
+        log.info("Deleting client: %s", toggl_client)
+        throttle.wait()
         with contextlib.suppress(HTTPError):
-            endpoint.delete(client)
-        time.sleep(delay)
-
-
-def _tag_cleanup(wid: int, config: BasicAuth, delay: int = 1) -> None:
-    endpoint = TagEndpoint(wid, config)
+            endpoint.delete(toggl_client)
+
+
+def _tag_cleanup(
+    wid: int,
+    config: BasicAuth,
+    delay: int = 1,
+    *,
+    client: Client | None = None,
+    throttle: Throttle | None = None,
+) -> None:
+    endpoint = TagEndpoint(wid, config, client=client)
+    throttle = throttle or Throttle(delay)
+    throttle.wait()
     for tag in endpoint.collect(refresh=True):
         log.info("Deleting tag: %s", tag)
+        throttle.wait()
         with contextlib.suppress(HTTPError):
             endpoint.delete(tag)
-        time.sleep(delay)
 
 
-def _org_cleanup(config: BasicAuth, delay: int = 1) -> None:
-    endpoint = OrganizationEndpoint(config)
+def _org_cleanup(
+    config: BasicAuth,
+    delay: int = 1,
+    *,
+    client: Client | None = None,
+    throttle: Throttle | None = None,
+) -> None:
+    endpoint = OrganizationEndpoint(config, client=client)
+    throttle = throttle or Throttle(delay)
+    throttle.wait()
     for org in endpoint.collect(refresh=True):
         if org.name == "Do-Not-Delete":
             continue
         log.info("Deleting org: %s", org)
+        throttle.wait()
         with contextlib.suppress(HTTPError):
             endpoint.delete(org)
-        time.sleep(delay)
 
 
 def cleanup():
     wid = int(os.getenv("TOGGL_WORKSPACE_ID", "0"))
     config = generate_authentication()
 
-    _project_cleanup(wid, config)
-    _tracker_cleanup(wid, config)
-    _client_cleanup(wid, config)
-    _tag_cleanup(wid, config)
-    _org_cleanup(config)
+    # NOTE: A single client keeps the connection alive across all deletes and
+    # a single throttle spaces out every request including the collects.
+    throttle = Throttle(1)
+    with Client() as client:
+        _project_cleanup(wid, config, client=client, throttle=throttle)
+        _tracker_cleanup(wid, config, client=client, throttle=throttle)
+        _client_cleanup(wid, config, client=client, throttle=throttle)
+        _tag_cleanup(wid, config, client=client, throttle=throttle)
+        _org_cleanup(config, client=client, throttle=throttle)
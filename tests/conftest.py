@@ -2,15 +2,16 @@
 
 import os
 import random
+import ssl
 import sys
 import time
 from datetime import date, datetime, timedelta, timezone
 
 import pytest
 from faker import Faker
-from httpx import BasicAuth
+from httpx import BasicAuth, Client, create_ssl_context
 
-from scripts.utils import cleanup
+from scripts.utils import Throttle, cleanup
 from toggl_api import (
     ClientBody,
     ClientEndpoint,
@@ -30,11 +31,17 @@ from toggl_api.models import TogglClass, TogglClient, TogglProject, TogglTag, To
 from toggl_api.reports import ReportBody
 
 
-@pytest.fixture(autouse=True)
-def _rate_limit(request):
+@pytest.fixture
+def _rate_limit():
     yield
-    if "integration" in request.keywords:
-        time.sleep(1)
+    time.sleep(1)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]):
+    # NOTE: Only requested by integration tests so unit tests skip the fixture.
+    for item in items:
+        if "integration" in item.keywords:
+            item.fixturenames.append("_rate_limit")  # type: ignore[attr-defined]
 
 
 @pytest.fixture(scope="session")
@@ -52,6 +59,21 @@ def config_setup() -> BasicAuth:
     return generate_authentication()
 
 
+@pytest.fixture(scope="session")
+def ssl_context() -> ssl.SSLContext:
+    # NOTE: Loading the CA bundle dominates client creation, so endpoint
+    # fixtures build their clients from one shared context.
+    return create_ssl_context()
+
+
+@pytest.fixture
+def http_client(ssl_context):
+    def http_client() -> Client:
+        return Client(verify=ssl_context)
+
+    return http_client
+
+
 @pytest.fixture
 def get_sqlite_cache(tmp_path):
     return SqliteCache(tmp_path, timedelta(days=1))
@@ -78,33 +100,28 @@ def user_id() -> int:
 
 
 @pytest.fixture
-def workspace_object(organization_id, config_setup, get_json_cache):
-    return WorkspaceEndpoint(organization_id, config_setup, get_json_cache)
+def workspace_object(organization_id, config_setup, get_json_cache, http_client):
+    return WorkspaceEndpoint(organization_id, config_setup, get_json_cache, client=http_client())
 
 
 @pytest.fixture
-def project_object(get_workspace_id, config_setup, get_json_cache):
-    return ProjectEndpoint(get_workspace_id, config_setup, get_json_cache)
+def project_object(get_workspace_id, config_setup, get_json_cache, http_client):
+    return ProjectEndpoint(get_workspace_id, config_setup, get_json_cache, client=http_client())
 
 
-@pytest.fixture
-def user_object(config_setup, get_json_cache) -> UserEndpoint:
+@pytest.fixture(scope="session")
+def user_object(config_setup) -> UserEndpoint:
     return UserEndpoint(config_setup)
 
 
 @pytest.fixture
-def tracker_object(get_workspace_id, config_setup, get_json_cache, user_object):
-    return TrackerEndpoint(get_workspace_id, config_setup, get_json_cache)
+def tracker_object(get_workspace_id, config_setup, get_json_cache, http_client):
+    return TrackerEndpoint(get_workspace_id, config_setup, get_json_cache, client=http_client())
 
 
 @pytest.fixture
-def tracker_object_sqlite(
-    get_workspace_id,
-    config_setup,
-    get_sqlite_cache,
-    user_object,
-):
-    return TrackerEndpoint(get_workspace_id, config_setup, get_sqlite_cache)
+def tracker_object_sqlite(get_workspace_id, config_setup, get_sqlite_cache, http_client):
+    return TrackerEndpoint(get_workspace_id, config_setup, get_sqlite_cache, client=http_client())
 
 
 @pytest.fixture
@@ -119,13 +136,13 @@ def add_tracker(tracker_object, faker):
 
 
 @pytest.fixture
-def client_object(get_json_cache, get_workspace_id, config_setup):
-    return ClientEndpoint(get_workspace_id, config_setup, get_json_cache)
+def client_object(get_json_cache, get_workspace_id, config_setup, http_client):
+    return ClientEndpoint(get_workspace_id, config_setup, get_json_cache, client=http_client())
 
 
 @pytest.fixture
-def tag_object(get_workspace_id, config_setup, get_json_cache):
-    return TagEndpoint(get_workspace_id, config_setup, get_json_cache)
+def tag_object(get_workspace_id, config_setup, get_json_cache, http_client):
+    return TagEndpoint(get_workspace_id, config_setup, get_json_cache, client=http_client())
 
 
 class ModelTest(TogglClass):
@@ -142,13 +159,13 @@ class EndPointTest(TogglCachedEndpoint):
 
 
 @pytest.fixture
-def meta_object(config_setup, get_workspace_id, get_json_cache):
-    return EndPointTest(config_setup, get_json_cache)
+def meta_object(config_setup, get_workspace_id, get_json_cache, http_client):
+    return EndPointTest(config_setup, get_json_cache, client=http_client())
 
 
 @pytest.fixture
-def meta_object_sqlite(config_setup, get_workspace_id, get_sqlite_cache):
-    return EndPointTest(config_setup, get_sqlite_cache)
+def meta_object_sqlite(config_setup, get_workspace_id, get_sqlite_cache, http_client):
+    return EndPointTest(config_setup, get_sqlite_cache, client=http_client())
 
 
 def pytest_sessionstart(session: pytest.Session):  # pragma: no cover
@@ -258,9 +275,12 @@ def gen_project(faker, number):
 
 @pytest.fixture
 def add_multiple_trackers(tracker_object, faker, gen_proj):
+    # NOTE: Primed so the first request is still spaced from creating the project.
+    throttle = Throttle(1)
+    throttle.wait()
     trackers = []
     for i in range(5, 10):
-        time.sleep(1)
+        throttle.wait()
         body = TrackerBody(
             description=faker.name(),
             project_id=gen_proj.id,
@@ -270,8 +290,9 @@ def add_multiple_trackers(tracker_object, faker, gen_proj):
         trackers.append(tracker_object.add(body=body))
 
     yield trackers
+    throttle.wait()
     for tracker in trackers:
-        time.sleep(1)
+        throttle.wait()
         tracker_object.delete(tracker)
 
 
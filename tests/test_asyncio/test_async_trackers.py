@@ -76,6 +76,28 @@ async def test_collect_params(atracker_ep: AsyncTrackerEndpoint, generate_tracke
     # TODO: Test Remote Params
 
 
+@pytest.mark.unit
+async def test_collect_refresh_saves(atracker_ep: AsyncTrackerEndpoint, get_test_data, httpx_mock):
+    for tracker in get_test_data:
+        tracker["tags"] = []
+    httpx_mock.add_response(json=get_test_data)
+
+    collection = await atracker_ep.collect(refresh=True)
+
+    assert len(await atracker_ep.cache.load()) == len(collection)
+
+
+@pytest.mark.unit
+async def test_request_deferred_save(atracker_ep: AsyncTrackerEndpoint, get_test_data, httpx_mock):
+    for tracker in get_test_data:
+        tracker["tags"] = []
+    httpx_mock.add_response(json=get_test_data)
+
+    collection = await atracker_ep.request("me/time_entries", refresh=True, defer_save=True)
+
+    assert len(await atracker_ep.load_cache()) == len(collection)
+
+
 @pytest.mark.integration
 async def test_bulk_edit(atracker_ep: AsyncTrackerEndpoint, gen_tracker_bd):
     tracker = await atracker_ep.add(gen_tracker_bd())
@@ -1,4 +1,5 @@
 import json
+import os
 import random
 import sys
 import time
@@ -346,3 +347,112 @@ def test_json_session_refresh(model_data, tmpdir):
 
     assert session.refresh(path)
     assert len(session.data) == 76  # noqa: PLR2004
+
+
+@pytest.mark.unit
+def test_json_session_load_unmodified(model_data, tmp_path, monkeypatch):
+    path = tmp_path / "model.json"
+
+    session = JSONSession()
+    session.load(path)
+    session.data.append(model_data["tracker"])
+    session.commit(path)
+
+    def _load(_: Path) -> None:
+        msg = "Unmodified cache file should not be parsed again!"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(session, "_load", _load)
+    session.load(path)
+    assert session.data == [model_data["tracker"]]
+
+
+@pytest.mark.unit
+def test_json_session_load_same_mtime(model_data, tmp_path):
+    path = tmp_path / "model.json"
+
+    session = JSONSession()
+    session.load(path)
+    session.commit(path)
+
+    other = JSONSession()
+    other.load(path)
+    other.data.append(model_data["tracker"])
+    other.commit(path)
+    # NOTE: Simulates a filesystem with coarse mtime resolution.
+    os.utime(path, ns=(session.modified, session.modified))
+
+    session.load(path)
+    assert session.data == [model_data["tracker"]]
+
+
+@pytest.mark.unit
+def test_query_hashed_values(model_data, tracker_object):
+    t = model_data.pop("tracker")
+    d = asdict(t)
+    for i in range(1, 6):
+        d["id"] = i
+        d["timestamp"] = datetime.now(timezone.utc)
+        tracker_object.save_cache(TogglTracker.from_kwargs(**d), RequestMethod.GET)
+
+    assert {m.id for m in tracker_object.query(TogglQuery("id", [1, 3, 42]))} == {1, 3}
+
+
+@pytest.mark.unit
+def test_add_batch_replaces_existing(model_data, tracker_object):
+    t = model_data.pop("tracker")
+    d = asdict(t)
+    trackers = []
+    for i in range(1, 4):
+        d["id"] = i
+        trackers.append(TogglTracker.from_kwargs(**d))
+
+    tracker_object.cache.session.data = []
+    tracker_object.cache.add(*trackers)
+    d["id"] = 2
+    d["name"] = "Replaced"
+    tracker_object.cache.add(TogglTracker.from_kwargs(**d))
+
+    assert len(tracker_object.cache.session.data) == 3  # noqa: PLR2004
+    assert tracker_object.cache.session.data[1].name == "Replaced"
+
+
+@pytest.mark.unit
+def test_cache_batched_commit(model_data, tracker_object, monkeypatch):
+    commits = []
+    monkeypatch.setattr(tracker_object.cache.session, "commit", lambda _: commits.append(1))
+
+    with tracker_object.cache:
+        tracker_object.save_cache(model_data["tracker"], RequestMethod.GET)
+        tracker_object.save_cache(model_data["tracker"], RequestMethod.PUT)
+        assert not commits
+
+    assert len(commits) == 1
+
+
+@pytest.mark.unit
+def test_decoder_interns_tag_names(get_workspace_id):
+    name = "interned-tag"
+    tag = TogglTag(1, name, workspace=get_workspace_id)
+
+    decoded = json.loads(json.dumps(tag, cls=CustomEncoder), cls=CustomDecoder)
+
+    assert decoded.name is sys.intern(name)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("name", ["123", "null"])
+def test_json_session_string_values(model_data, tmp_path, name):
+    path = tmp_path / "model.json"
+    tracker = deepcopy(model_data["tracker"])
+    tracker["name"] = name
+
+    session = JSONSession()
+    session.load(path)
+    session.data.append(tracker)
+    session.commit(path)
+
+    new_session = JSONSession()
+    new_session.load(path)
+    assert new_session.data[0].name == name
+    assert isinstance(new_session.data[0].name, str)
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 import pytest
 
 from toggl_api import TogglTracker
-from toggl_api.meta import BaseBody, TogglEndpoint
+from toggl_api.meta import BaseBody, RequestMethod, TogglEndpoint
 
 
 @pytest.mark.unit
@@ -63,3 +63,21 @@ class BodyTest(BaseBody):
 @pytest.mark.unit
 def test_base_body(parameter, endpoint, expected):
     assert BodyTest._verify_endpoint_parameter(parameter, endpoint) is expected  # noqa: SLF001
+
+
+@pytest.mark.unit
+def test_base_body_endpoint_parameters():
+    assert BodyTest._endpoint_parameters("generic_endpoint") == {"parameter"}  # noqa: SLF001
+    assert not BodyTest._endpoint_parameters("generic_endpoint_two")  # noqa: SLF001
+
+
+@pytest.mark.unit
+def test_build_request_client_defaults(meta_object):
+    meta_object.client.params = {"default": "value"}
+    request = meta_object._build_request("me", None, None, RequestMethod.GET)  # noqa: SLF001
+    assert request.url.params["default"] == "value"
+
+    request = meta_object._build_request("me", None, {"a": [1, 2]}, RequestMethod.POST)  # noqa: SLF001
+    assert request.url.params["default"] == "value"
+    assert request.content == b'{"a":[1,2]}'
+    assert request.headers["content-type"] == "application/json"
@@ -1,3 +1,4 @@
+import gc
 import random
 import sys
 import time
@@ -7,6 +8,7 @@ from pathlib import Path
 
 import pytest
 import sqlalchemy
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Query, Session
 
 from toggl_api.meta import RequestMethod
@@ -51,6 +53,23 @@ def test_schema(table, setup_schema):
     assert table in setup_schema.tables
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("table", ["organization", "workspace", "client", "project", "tag", "tracker"])
+def test_schema_base_columns(table, setup_schema):
+    # NOTE: 'UTCDateTime' always uses a timezone aware implementation, so the
+    # shared columns match the previous per table declarations.
+    dialect = sqlite.dialect()
+    for column in ("created", "timestamp"):
+        column_type = setup_schema.tables[table].c[column].type
+        assert column_type.impl.timezone
+        assert column_type.compile(dialect) == UTCDateTime().compile(dialect)
+
+
+@pytest.mark.unit
+def test_schema_reused(setup_schema, db_conn):
+    assert register_tables(db_conn) is setup_schema
+
+
 @pytest.mark.unit
 def test_model_creation(setup_schema, db_conn):
     get_workspace_id = random.randint(1, 100_000)
@@ -273,3 +292,131 @@ def test_sqlite_save(tmp_path, get_workspace_id):
 def test_utc_datetime_decorator_error(value):
     decorator = UTCDateTime()
     assert decorator.process_bind_param(value, None) is None
+
+
+@pytest.mark.unit
+def test_add_batch_sqlite(tracker_object_sqlite, model_data):
+    d = asdict(model_data["tracker"])
+    d["tags"] = []
+    trackers = []
+    for i in range(1, 4):
+        d["id"] = i
+        trackers.append(TogglTracker.from_kwargs(**d))
+    tracker_object_sqlite.cache.add(*trackers[:2])
+
+    d["id"] = 2
+    d["name"] = "Replaced"
+    tracker_object_sqlite.cache.add(TogglTracker.from_kwargs(**d), trackers[2])
+
+    assert tracker_object_sqlite.cache.load().count() == 3  # noqa: PLR2004
+    assert tracker_object_sqlite.cache.find({"id": 2}).name == "Replaced"
+
+
+@pytest.mark.unit
+def test_batched_commit_sqlite(tracker_object_sqlite, model_data, monkeypatch):
+    cache = tracker_object_sqlite.cache
+    commit = cache.session.commit
+    commits = []
+
+    def counted_commit():
+        commits.append(1)
+        commit()
+
+    monkeypatch.setattr(cache.session, "commit", counted_commit)
+
+    tracker = model_data["tracker"]
+    with cache:
+        cache.add(tracker)
+        tracker.name = "batched"
+        cache.update(tracker)
+        assert not commits
+
+    assert len(commits) == 1
+    assert cache.find(tracker).name == "batched"
+
+
+@pytest.mark.unit
+def test_batched_commit_sqlite_nested(tracker_object_sqlite, model_data, monkeypatch):
+    cache = tracker_object_sqlite.cache
+    commit = cache.session.commit
+    commits = []
+
+    def counted_commit():
+        commits.append(1)
+        commit()
+
+    monkeypatch.setattr(cache.session, "commit", counted_commit)
+
+    tracker = model_data["tracker"]
+    with cache:
+        with cache:
+            cache.add(tracker)
+        assert not commits
+        tracker.name = "nested"
+        cache.update(tracker)
+        assert not commits
+
+    assert len(commits) == 1
+    assert cache.find(tracker).name == "nested"
+
+
+@pytest.mark.unit
+def test_batched_commit_sqlite_error(tracker_object_sqlite, model_data, monkeypatch):
+    cache = tracker_object_sqlite.cache
+    commit = cache.session.commit
+    commits = []
+
+    def counted_commit():
+        commits.append(1)
+        commit()
+
+    monkeypatch.setattr(cache.session, "commit", counted_commit)
+
+    tracker = model_data["tracker"]
+    msg = "batch failed"
+
+    def failing_batch():
+        with cache:
+            cache.add(tracker)
+            raise ValueError(msg)
+
+    with pytest.raises(ValueError, match=msg):
+        failing_batch()
+
+    assert not commits
+    assert cache.find(tracker) is None
+
+    cache.add(tracker)
+    assert len(commits) == 1
+
+
+@pytest.mark.unit
+def test_load_expired_sqlite(tracker_object_sqlite, model_data):
+    d = asdict(model_data["tracker"])
+    d["tags"] = []
+    d["id"] = 1
+    fresh = TogglTracker.from_kwargs(**d)
+    d["id"] = 2
+    d["timestamp"] = datetime.now(timezone.utc) - timedelta(days=5)
+    tracker_object_sqlite.cache.add(fresh, TogglTracker.from_kwargs(**d))
+
+    assert [t.id for t in tracker_object_sqlite.cache.load()] == [1]
+
+
+@pytest.mark.unit
+def test_session_closed_on_collect(tmp_path, monkeypatch):
+    closed = []
+    close = Session.close
+
+    def tracked_close(self):
+        closed.append(self)
+        close(self)
+
+    monkeypatch.setattr(Session, "close", tracked_close)
+
+    cache = SqliteCache(tmp_path)
+    session = cache.session
+    del cache
+    gc.collect()
+
+    assert closed == [session]
@@ -1,8 +1,9 @@
 from dataclasses import fields
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from toggl_api.models import as_dict_custom
+from toggl_api.models import TogglTag, as_dict_custom
 
 
 @pytest.mark.unit
@@ -17,3 +18,14 @@ def test_etters(model_data):
 def test_as_dict_custom(model_data):
     for model in model_data.values():
         assert isinstance(as_dict_custom(model), dict)
+
+
+@pytest.mark.unit
+def test_timestamp_utc():
+    local = datetime(2020, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+    tag = TogglTag(1, "test", timestamp=local)
+    assert tag.timestamp == local
+    assert tag.timestamp.tzinfo is timezone.utc
+
+    naive = TogglTag(1, "test", timestamp=datetime(2020, 1, 1, 12))  # noqa: DTZ001
+    assert naive.timestamp == datetime(2020, 1, 1, 12, tzinfo=timezone.utc)
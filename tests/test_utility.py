@@ -1,4 +1,5 @@
 import subprocess  # noqa: S404
+import time
 from datetime import date, datetime, timezone
 from pathlib import Path
 
@@ -6,7 +7,7 @@ import pytest
 import tomli
 
 from toggl_api import __version__
-from toggl_api._utility import _requires, format_iso, get_workspace, parse_iso  # noqa: PLC2701
+from toggl_api._utility import _requires, format_iso, get_timestamp, get_workspace, parse_iso  # noqa: PLC2701
 
 
 @pytest.mark.unit
@@ -52,6 +53,38 @@ def test_parse_iso():
     )
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    [
+        1577836800,
+        datetime(2020, 1, 1, tzinfo=timezone.utc),
+    ],
+)
+def test_get_timestamp(value):
+    assert get_timestamp(value) == 1577836800  # noqa: PLR2004
+
+
+@pytest.mark.unit
+def test_get_timestamp_date():
+    assert get_timestamp(date(2020, 1, 1)) == int(time.mktime(date(2020, 1, 1).timetuple()))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2020-01-01T01:01:01+00:00",
+        "2020-01-01T03:01:01+02:00",
+        "2020-01-01T01:01:01",
+    ],
+)
+def test_parse_iso_offset(value):
+    iso = parse_iso(value)
+    assert iso == datetime(2020, 1, 1, 1, 1, 1, tzinfo=timezone.utc)
+    assert iso.tzinfo is timezone.utc
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     ("data", "result"),
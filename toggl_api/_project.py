@@ -216,6 +216,9 @@ class ProjectEndpoint(TogglCachedEndpoint[TogglProject]):
     }
     """Basic colors available for projects in order of the API index."""
 
+    # NOTE: Materialized once so color id lookups don't rebuild the sequence.
+    _COLOR_VALUES: Final[tuple[str, ...]] = tuple(BASIC_COLORS.values())
+
     def __init__(
         self,
         workspace_id: int | TogglWorkspace,
@@ -506,8 +509,7 @@ class ProjectEndpoint(TogglCachedEndpoint[TogglProject]):
         Returns:
             Index of the provided color name.
         """
-        colors = list(cls.BASIC_COLORS.values())
-        return colors.index(color)
+        return cls._COLOR_VALUES.index(color)
 
     @property
     def endpoint(self) -> str:
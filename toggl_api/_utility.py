@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import functools
 import importlib.util
+import sys
 import time
 from datetime import date, datetime, timezone
-from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, Final, ParamSpec, TypeVar
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -13,11 +14,17 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
+# NOTE: Module lookups walk 'sys.path' so each result is only resolved once.
+@functools.cache
+def _module_available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
 def _requires(module: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
     def requires_dec(fn: Callable[P, R]) -> Callable[P, R]:
         @functools.wraps(fn)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            if importlib.util.find_spec(module) is None:
+            if not _module_available(module):
                 msg = f"'{module.title()}' is required for this functionality!"
                 raise ImportError(msg)
             return fn(*args, **kwargs)
@@ -27,16 +34,14 @@ def _requires(module: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
     return requires_dec
 
 
+_WORKSPACE_KEYS: Final[tuple[str, ...]] = ("workspace_id", "wid", "workspace")
+
+
 def get_workspace(data: dict[str, Any]) -> int:
-    workspace = data.get("workspace_id")
-    if isinstance(workspace, int):
-        return workspace
-    workspace = data.get("wid")
-    if isinstance(workspace, int):
-        return workspace
-    workspace = data.get("workspace")
-    if isinstance(workspace, int):
-        return workspace
+    for key in _WORKSPACE_KEYS:
+        workspace = data.get(key)
+        if isinstance(workspace, int):
+            return workspace
     msg = "Workspace not found!"
     raise KeyError(msg)
 
@@ -44,6 +49,9 @@ def get_workspace(data: dict[str, Any]) -> int:
 def get_timestamp(ts: date | datetime | int) -> int:
     if isinstance(ts, int):
         return ts
+    if isinstance(ts, datetime):
+        return int(ts.timestamp())
+    # NOTE: Plain dates keep resolving to local midnight.
     return int(time.mktime(ts.timetuple()))
 
 
@@ -61,6 +69,13 @@ def parse_iso(date_obj: str | datetime | date) -> datetime | date:
         return date_obj
     if isinstance(date_obj, datetime):
         return date_obj.replace(tzinfo=timezone.utc)
-    if date_obj.endswith("Z"):
-        date_obj = date_obj[:-1] + "-00:00"
-    return datetime.fromisoformat(date_obj).replace(tzinfo=timezone.utc)
+    # NOTE: Toggl API timestamps are ISO 8601, but Python 3.10 does not parse
+    # the 'Z' suffix.
+    if sys.version_info < (3, 11) and date_obj.endswith("Z"):
+        date_obj = date_obj[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(date_obj)
+    if parsed.tzinfo is timezone.utc:
+        return parsed
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
@@ -298,7 +298,7 @@ class WorkspaceEndpoint(TogglCachedEndpoint[TogglWorkspace]):
 
     def _validate_collect_since(self, since: datetime | int) -> int:
         since = get_timestamp(since)
-        now = int(time.mktime(datetime.now(tz=timezone.utc).timetuple()))
+        now = int(time.time())
         if since > now:
             msg = "The 'since' argument needs to be before the current time!"
             raise DateTimeError(msg)
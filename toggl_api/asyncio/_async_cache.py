@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Sequence
 from datetime import timedelta
 from os import PathLike
 from pathlib import Path
@@ -12,10 +11,11 @@ from typing import TYPE_CHECKING, Any, Final, Generic, TypeVar, cast
 
 from toggl_api._exceptions import MissingParentError
 from toggl_api.meta._enums import RequestMethod
+from toggl_api.meta.cache._base_cache import _ENTRY_SEQUENCES
 from toggl_api.models import TogglClass
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Awaitable, Callable, Iterable
     from os import PathLike
 
     from ._async_endpoint import TogglAsyncCachedEndpoint
@@ -65,6 +65,14 @@ class TogglAsyncCache(ABC, Generic[T]):
 
     __slots__ = ("_cache_path", "_expire_after", "_parent")
 
+    METHOD_MAP: Final[dict[RequestMethod, str]] = {
+        RequestMethod.GET: "add",
+        RequestMethod.POST: "add",
+        RequestMethod.PATCH: "update",
+        RequestMethod.PUT: "add",
+    }
+    """Names of the cache methods each request method is handled by."""
+
     def __init__(
         self,
         path: Path | PathLike | str,
@@ -84,7 +92,7 @@ class TogglAsyncCache(ABC, Generic[T]):
         func = self.find_method(method)
         if func is None:
             return
-        await (func(*entry) if isinstance(entry, Sequence) else func(entry))
+        await (func(*entry) if isinstance(entry, _ENTRY_SEQUENCES) else func(entry))
 
     @abstractmethod
     async def find(self, pk: int) -> T | None: ...
@@ -99,13 +107,8 @@ class TogglAsyncCache(ABC, Generic[T]):
     async def delete(self, *entries: T) -> None: ...
 
     def find_method(self, method: RequestMethod) -> Callable[[Any], Awaitable[Any]] | None:
-        match_func: Final[dict[RequestMethod, Callable[[Any], Awaitable[Any]]]] = {
-            RequestMethod.GET: self.add,
-            RequestMethod.POST: self.add,
-            RequestMethod.PATCH: self.update,
-            RequestMethod.PUT: self.add,
-        }
-        return match_func.get(method)
+        name = self.METHOD_MAP.get(method)
+        return None if name is None else getattr(self, name)
 
     @property
     @abstractmethod
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import random
 from abc import ABC
@@ -9,7 +10,7 @@ from datetime import timedelta
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, ClassVar, Final, Generic, TypeVar, cast
 
-from httpx import URL, AsyncClient, BasicAuth, HTTPStatusError, Request, Response, Timeout, codes
+from httpx import URL, AsyncClient, BasicAuth, Headers, HTTPStatusError, Request, Response, Timeout, codes
 
 from toggl_api._exceptions import NoCacheAssignedError
 from toggl_api.meta import RequestMethod
@@ -45,7 +46,8 @@ class TogglAsyncEndpoint(ABC, Generic[T]):
     """
 
     BASE_ENDPOINT: ClassVar[URL] = URL("https://api.track.toggl.com/api/v9/")
-    HEADERS: Final[dict] = {"content-type": "application/json"}
+    # NOTE: Built once so httpx can reuse the already encoded header list.
+    HEADERS: Final[Headers] = Headers({"content-type": "application/json"})
     MODEL: type[T] | None = None
 
     def __init__(
@@ -126,15 +128,21 @@ class TogglAsyncEndpoint(ABC, Generic[T]):
         method: RequestMethod,
     ) -> Request:
         url = self.BASE_ENDPOINT.join(parameters)
-        headers = headers or self.HEADERS
 
         requires_body = method not in {RequestMethod.DELETE, RequestMethod.GET}
-        return self.client.build_request(
+        if not requires_body or body is None:
+            return self.client.build_request(method.name.lower(), url, headers=headers or self.HEADERS)
+
+        # NOTE: Encoded without the default whitespace as report bodies can
+        # carry long id lists. Content type is kept for custom headers.
+        request = self.client.build_request(
             method.name.lower(),
             url,
-            headers=headers,
-            json=body if requires_body else None,
+            headers=headers or self.HEADERS,
+            content=json.dumps(body, separators=(",", ":")).encode(),
         )
+        request.headers.setdefault("content-type", "application/json")
+        return request
 
     async def request(
         self,
@@ -214,6 +222,8 @@ class TogglAsyncCachedEndpoint(TogglAsyncEndpoint[T]):
         load_cache: Method for loading cache into memory.
         save_cache: Method for saving cache to disk. Ignored if expiry is set
             to 0 seconds.
+        flush: Waits for any pending background tasks such as deferred cache
+            writes to finish.
     """
 
     __slots__ = ("_cache",)
@@ -248,6 +258,7 @@ class TogglAsyncCachedEndpoint(TogglAsyncEndpoint[T]):
         *,
         refresh: bool = False,
         raw: bool = False,
+        defer_save: bool = False,
     ) -> T | list[T] | Response | None:
         """Overridden request method with builtin cache.
 
@@ -259,6 +270,9 @@ class TogglAsyncCachedEndpoint(TogglAsyncEndpoint[T]):
             method: Request method. Defaults to GET.
             refresh: Whether to refresh the cache or not. Defaults to False.
             raw (bool): Whether to use the raw data. Defaults to False.
+            defer_save: Whether to save the response to the cache in a
+                background task instead of before returning. Pending writes
+                are flushed before the cache is loaded again. Defaults to False.
 
         Raises:
             HTTPStatusError: If the request is not a success.
@@ -267,8 +281,8 @@ class TogglAsyncCachedEndpoint(TogglAsyncEndpoint[T]):
             Toggl API response data processed into TogglClass objects or not
                 depending on arguments.
         """
-        data = await self.load_cache() if self.cache and self.MODEL is not None else None
-        if data and not refresh:
+        data = await self.load_cache() if not refresh and self.cache and self.MODEL is not None else None
+        if data:
             log.info(
                 "Loading request %s%s data from cache.",
                 self.BASE_ENDPOINT,
@@ -291,7 +305,10 @@ class TogglAsyncCachedEndpoint(TogglAsyncEndpoint[T]):
             return None
 
         if self.cache and self.MODEL is not None:
-            await self.save_cache(response, method)
+            if defer_save:
+                await self._create_task(self.save_cache(response, method), name="save_cache")
+            else:
+                await self.save_cache(response, method)
 
         return response
 
@@ -300,6 +317,8 @@ class TogglAsyncCachedEndpoint(TogglAsyncEndpoint[T]):
         if self.cache is None:
             raise NoCacheAssignedError
 
+        # NOTE: Pending deferred saves are written first so reads are never stale.
+        await self.flush()
         return await self.cache.load()
 
     async def save_cache(
@@ -325,6 +344,11 @@ class TogglAsyncCachedEndpoint(TogglAsyncEndpoint[T]):
         task.add_done_callback(self.__tasks.remove)
         return task
 
+    async def flush(self) -> None:
+        """Waits for any pending background tasks such as deferred cache writes to finish."""
+        if self.__tasks:
+            await asyncio.gather(*self.__tasks)
+
     @property
     def cache(self) -> AsyncSqliteCache[T] | None:
         return self._cache
@@ -76,6 +76,9 @@ class AsyncProjectEndpoint(TogglAsyncCachedEndpoint[TogglProject]):
     }
     """Basic colors available for projects in order of the API index."""
 
+    # NOTE: Materialized once so color id lookups don't rebuild the sequence.
+    _COLOR_VALUES: Final[tuple[str, ...]] = tuple(BASIC_COLORS.values())
+
     def __init__(
         self,
         workspace_id: int | TogglWorkspace,
@@ -368,8 +371,7 @@ class AsyncProjectEndpoint(TogglAsyncCachedEndpoint[TogglProject]):
         Returns:
             Index of the provided color name.
         """
-        colors = list(cls.BASIC_COLORS.values())
-        return colors.index(color)
+        return cls._COLOR_VALUES.index(color)
 
     @property
     def endpoint(self) -> str:
@@ -9,7 +9,14 @@ from httpx import URL, AsyncClient, BasicAuth, Response
 from toggl_api import TogglProject, TogglWorkspace
 from toggl_api._utility import format_iso
 from toggl_api.meta import RequestMethod
-from toggl_api.reports import REPORT_FORMATS, PaginatedResult, PaginationOptions, ReportBody, _validate_extension
+from toggl_api.reports import (
+    _DEFAULT_PAGINATION,
+    REPORT_FORMATS,
+    PaginatedResult,
+    PaginationOptions,
+    ReportBody,
+    _validate_extension,
+)
 
 from ._async_endpoint import TogglAsyncEndpoint
 
@@ -218,7 +225,7 @@ class AsyncDetailedReportEndpoint(AsyncReportEndpoint):
             Data with pagination information if required.
         """
 
-        pagination = pagination or PaginationOptions()
+        pagination = pagination or _DEFAULT_PAGINATION
 
         response = await self.request(
             self.endpoint,
@@ -263,7 +270,7 @@ class AsyncDetailedReportEndpoint(AsyncReportEndpoint):
         """
         _validate_extension(extension)
 
-        pagination = pagination or PaginationOptions()
+        pagination = pagination or _DEFAULT_PAGINATION
 
         response = await self.request(
             f"{self.endpoint}.{extension}",
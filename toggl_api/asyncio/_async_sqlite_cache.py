@@ -7,13 +7,13 @@ import asyncio
 from datetime import datetime, timedelta, timezone
 from itertools import chain
 from os import PathLike
-from typing import TYPE_CHECKING, TypeVar, cast
+from typing import TYPE_CHECKING, TypeVar
 
-from sqlalchemy import ColumnElement, MetaData, select
+from sqlalchemy import MetaData, select
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 
 from toggl_api.models import TogglClass
-from toggl_api.models._schema import _create_mappings
+from toggl_api.models._schema import _get_metadata
 
 from ._async_cache import TogglAsyncCache
 
@@ -26,9 +26,7 @@ if TYPE_CHECKING:
 
 async def async_register_tables(engine: AsyncEngine) -> MetaData:
     """Helper function for setting up database with SQLAlchemy models."""
-    meta = MetaData()
-
-    _create_mappings(meta)
+    meta = _get_metadata()
 
     async with engine.begin() as conn:
         await conn.run_sync(meta.create_all)
@@ -105,7 +103,7 @@ class AsyncSqliteCache(TogglAsyncCache[T]):
         if self.expire_after is not None:
             # TODO: Routine that checks for expiration and discards instead of ignoring on load.
             min_ts = datetime.now(timezone.utc) - self.expire_after
-            stmt = stmt.filter(cast(ColumnElement[bool], self.model.timestamp > min_ts))
+            stmt = stmt.filter(self.model.timestamp > min_ts)  # type: ignore[arg-type]
 
         async with AsyncSession(self.database, expire_on_commit=False) as session:
             return list(chain.from_iterable((await session.execute(stmt)).fetchall()))
@@ -8,7 +8,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, cast
 
 from httpx import AsyncClient, HTTPStatusError, Response, codes
-from sqlalchemy import ColumnElement, ScalarResult, select
+from sqlalchemy import ScalarResult, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from toggl_api import DateTimeError, TogglWorkspace
@@ -137,7 +137,7 @@ class AsyncWorkspaceEndpoint(TogglAsyncCachedEndpoint[TogglWorkspace]):
         statement = select(TogglWorkspace)
         if isinstance(since, int):
             ts = datetime.fromtimestamp(since, timezone.utc)
-            statement = statement.filter(cast(ColumnElement[bool], TogglWorkspace.timestamp > ts))
+            statement = statement.filter(TogglWorkspace.timestamp > ts)  # type: ignore[arg-type]
 
         cache = cast(AsyncSqliteCache[TogglWorkspace], self.cache)
         async with AsyncSession(cache.database, expire_on_commit=False) as session:
@@ -145,7 +145,7 @@ class AsyncWorkspaceEndpoint(TogglAsyncCachedEndpoint[TogglWorkspace]):
 
     def _validate_collect_since(self, since: datetime | int) -> int:
         since = get_timestamp(since)
-        now = int(time.mktime(datetime.now(tz=timezone.utc).timetuple()))
+        now = int(time.time())
         if since > now:
             msg = "The 'since' argument needs to be before the current time!"
             raise DateTimeError(msg)
@@ -7,6 +7,7 @@ Classes:
 from __future__ import annotations
 
 import atexit
+import json
 import logging
 import random
 import time
@@ -15,7 +16,7 @@ from json import JSONDecodeError
 from typing import Any, ClassVar, Final, Generic, TypeVar
 
 import httpx
-from httpx import BasicAuth, Client, HTTPStatusError, Request, Response, Timeout, codes
+from httpx import BasicAuth, Client, Headers, HTTPStatusError, Request, Response, Timeout, codes
 
 from toggl_api.models import TogglClass
 
@@ -48,7 +49,8 @@ class TogglEndpoint(ABC, Generic[T]):
     """
 
     BASE_ENDPOINT: ClassVar[str] = "https://api.track.toggl.com/api/v9/"
-    HEADERS: Final[dict] = {"content-type": "application/json"}
+    # NOTE: Built once so httpx can reuse the already encoded header list.
+    HEADERS: Final[Headers] = Headers({"content-type": "application/json"})
     MODEL: type[T] | None = None
 
     __slots__ = ("client", "re_raise", "retries", "workspace_id")
@@ -135,15 +137,21 @@ class TogglEndpoint(ABC, Generic[T]):
         method: RequestMethod,
     ) -> Request:
         url = self.BASE_ENDPOINT + parameters
-        headers = headers or self.HEADERS
 
         requires_body = method not in {RequestMethod.DELETE, RequestMethod.GET}
-        return self.client.build_request(
+        if not requires_body or body is None:
+            return self.client.build_request(method.name.lower(), url, headers=headers or self.HEADERS)
+
+        # NOTE: Encoded without the default whitespace as report bodies can
+        # carry long id lists. Content type is kept for custom headers.
+        request = self.client.build_request(
             method.name.lower(),
             url,
-            headers=headers,
-            json=body if requires_body else None,
+            headers=headers or self.HEADERS,
+            content=json.dumps(body, separators=(",", ":")).encode(),
         )
+        request.headers.setdefault("content-type", "application/json")
+        return request
 
     def request(
         self,
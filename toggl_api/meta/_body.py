@@ -1,3 +1,4 @@
+import functools
 from abc import abstractmethod
 from collections.abc import Iterator, Mapping
 from dataclasses import MISSING, Field, dataclass
@@ -6,6 +7,8 @@ from typing import Any, cast
 
 @dataclass
 class BaseBody(Mapping):
+    __slots__ = ()
+
     @abstractmethod
     def format(self, endpoint: str, **body: Any) -> dict[str, Any]:
         pass
@@ -13,12 +16,23 @@ class BaseBody(Mapping):
     @classmethod
     def _verify_endpoint_parameter(cls, parameter: str, endpoint: str) -> bool:
         """Checks if a body parameter is valid for a specified endpoint."""
-        field = cls.__dataclass_fields__.get(parameter)
-        if field is None:
+        if parameter in cls._endpoint_parameters(endpoint):
+            return True
+        if parameter not in cls.__dataclass_fields__:
             msg = "Validating a non-existant field!"
             raise KeyError(msg)
-        endpoints = field.metadata.get("endpoints", frozenset())
-        return not endpoints or endpoint in endpoints
+        return False
+
+    @classmethod
+    @functools.cache
+    def _endpoint_parameters(cls, endpoint: str) -> frozenset[str]:
+        """Collects all body parameters that are valid for a specified endpoint."""
+        parameters = set()
+        for name, field in cls.__dataclass_fields__.items():
+            endpoints = field.metadata.get("endpoints")
+            if not endpoints or endpoint in endpoints:
+                parameters.add(name)
+        return frozenset(parameters)
 
     def __iter__(self) -> Iterator[Any]:
         yield from self.format("")
@@ -117,8 +117,8 @@ class TogglCachedEndpoint(TogglEndpoint[T]):
             Toggl API response data processed into TogglClass objects or not
                 depending on arguments.
         """
-        data = self.load_cache() if self.cache and self.MODEL is not None else None
-        if data and not refresh:
+        data = self.load_cache() if not refresh and self.cache and self.MODEL is not None else None
+        if data:
             log.info(
                 "Loading request %s%s data from cache.",
                 self.BASE_ENDPOINT,
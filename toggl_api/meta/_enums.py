@@ -1,7 +1,7 @@
 import enum
 
 
-class RequestMethod(enum.Enum):
+class RequestMethod(enum.IntEnum):
     """Self explanatory enumerations describing the different request types
     primarily for selecting request methods."""
 
@@ -1,10 +1,26 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from ._base_cache import Comparison, MissingParentError, TogglCache, TogglQuery
 from ._json_cache import CustomDecoder, CustomEncoder, JSONCache, JSONSession
 
-try:  # noqa: SIM105
-    from ._sqlite_cache import SqliteCache
-except ImportError:
-    pass
+if TYPE_CHECKING:
+    from ._sqlite_cache import SqliteCache  # noqa: TC004
+
+
+def __getattr__(name: str) -> Any:
+    # NOTE: The SQLite backend is only imported once it is requested.
+    if name == "SqliteCache":
+        try:
+            from ._sqlite_cache import SqliteCache  # noqa: PLC0415
+        except ImportError as err:
+            raise AttributeError(name) from err
+        return SqliteCache
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 __all__ = (
     "Comparison",
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import enum
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
@@ -13,12 +12,16 @@ from toggl_api.meta._enums import RequestMethod
 from toggl_api.models import TogglClass
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Iterable, Sequence
     from os import PathLike
 
     from toggl_api.meta import TogglCachedEndpoint
 
 
+# NOTE: A plain tuple of types, as isinstance against a union or ABC is slower per save.
+_ENTRY_SEQUENCES: Final = (list, tuple)
+
+
 class Comparison(enum.Enum):
     EQUAL = enum.auto()
     LESS_THEN = enum.auto()
@@ -73,6 +76,14 @@ class TogglCache(ABC, Generic[TC]):
     Integrates as the backend for the [TogglCachedEndpoint][toggl_api.meta.TogglCachedEndpoint]
     in order to store requested models locally.
 
+    Examples:
+        Using the cache as a context manager defers commits of any saves until
+        the block exits, so a batch of saves is only committed once.
+
+        >>> with cache:
+        ...     cache.save(trackers, RequestMethod.GET)
+        ...     cache.save(trackers, RequestMethod.PUT)
+
     Params:
         path: Location where the cache will be saved.
         expire_after: After how much time should the cache expire.
@@ -107,7 +118,15 @@ class TogglCache(ABC, Generic[TC]):
             accessed.
     """
 
-    __slots__ = ("_cache_path", "_expire_after", "_parent")
+    __slots__ = ("_batch_depth", "_cache_path", "_dirty", "_expire_after", "_parent")
+
+    METHOD_MAP: Final[dict[RequestMethod, str]] = {
+        RequestMethod.GET: "add",
+        RequestMethod.POST: "update",
+        RequestMethod.PATCH: "update",
+        RequestMethod.PUT: "add",
+    }
+    """Names of the cache methods each request method is handled by."""
 
     def __init__(
         self,
@@ -120,6 +139,26 @@ class TogglCache(ABC, Generic[TC]):
 
         self._expire_after = timedelta(seconds=expire_after) if isinstance(expire_after, int) else expire_after
         self._parent = parent
+        self._batch_depth = 0
+        self._dirty = False
+
+    def __enter__(self) -> TogglCache[TC]:
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        # NOTE: Nested blocks leave the commit to the outermost block.
+        self._batch_depth -= 1
+        if self._batch_depth or not self._dirty:
+            return
+        self._dirty = False
+        if exc_type is not None:
+            self._rollback()
+            return
+        self.commit()
+
+    def _rollback(self) -> None:
+        """Discards pending changes when a batch fails. No-op by default."""
 
     @abstractmethod
     def commit(self) -> None: ...
@@ -131,8 +170,15 @@ class TogglCache(ABC, Generic[TC]):
         func = self.find_method(method)
         if func is None:
             return
-        func(*entry) if isinstance(entry, Sequence) else func(entry)
-        self.commit()
+        func(*entry) if isinstance(entry, _ENTRY_SEQUENCES) else func(entry)
+        self._commit_or_defer()
+
+    def _commit_or_defer(self) -> None:
+        # NOTE: Inside a cache context the commit is deferred until exit.
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.commit()
 
     @abstractmethod
     def find(self, entry: TC | dict[str, Any]) -> TC | None: ...
@@ -150,13 +196,8 @@ class TogglCache(ABC, Generic[TC]):
     def query(self, *query: TogglQuery, distinct: bool = False) -> Iterable[TC]: ...
 
     def find_method(self, method: RequestMethod) -> Callable | None:
-        match_func: Final[dict[RequestMethod, Callable]] = {
-            RequestMethod.GET: self.add,
-            RequestMethod.POST: self.update,
-            RequestMethod.PATCH: self.update,
-            RequestMethod.PUT: self.add,
-        }
-        return match_func.get(method)
+        name = self.METHOD_MAP.get(method)
+        return None if name is None else getattr(self, name)
 
     @property
     @abstractmethod
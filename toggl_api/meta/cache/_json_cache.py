@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import contextlib
+import heapq
 import json
 import logging
+import operator
+import sys
 import time
 from collections import defaultdict
 from collections.abc import Hashable, Sequence
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime, timedelta, timezone
 from os import PathLike
 from typing import TYPE_CHECKING, Any, Final, Generic, TypeVar
@@ -26,8 +28,8 @@ from toggl_api.models import (
 from ._base_cache import Comparison, TogglCache, TogglQuery
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
-    from os import PathLike
+    from collections.abc import Callable, Iterable
+    from os import PathLike, stat_result
     from pathlib import Path
 
     from toggl_api.meta import RequestMethod
@@ -65,7 +67,8 @@ class JSONSession(Generic[T]):
         save: Saves the data to a JSON file. Setting current timestamp and
             version.
         load: Loads the data from disk and stores it in the data attribute.
-            Invalidates any entries older than expire argument.
+            Skipped if the file hasn't been modified since the last load or
+            commit.
         refresh: Utility method that checks if cache has been updated.
         process_data: Processes models according to set attributes.
     """
@@ -74,55 +77,82 @@ class JSONSession(Generic[T]):
     version: str = field(init=False, default=version)
     data: list[T] = field(default_factory=list)
     modified: int = field(init=False, default=0)
+    _size: int = field(init=False, default=-1, repr=False)
+
+    @staticmethod
+    def _stat(path: Path) -> stat_result | None:
+        # NOTE: A single stat call doubles as the existence check.
+        try:
+            return path.stat()
+        except FileNotFoundError:
+            return None
+
+    def _unchanged(self, stat: stat_result) -> bool:
+        # NOTE: Size is compared as well because filesystems with coarse mtime
+        # resolution can hide another write made within the same tick.
+        return stat.st_mtime_ns == self.modified and stat.st_size == self._size
+
+    def _track(self, stat: stat_result) -> None:
+        self.modified = stat.st_mtime_ns
+        self._size = stat.st_size
 
     def refresh(self, path: Path) -> bool:
-        if path.exists() and path.stat().st_mtime_ns > self.modified:
-            self.modified = path.stat().st_mtime_ns
+        stat = self._stat(path)
+        if stat is not None and stat.st_mtime_ns >= self.modified and not self._unchanged(stat):
+            self._track(stat)
             self.data = self._diff(self._load(path)["data"], self.modified)
             return True
         return False
 
     def _save(self, path: Path, data: dict[str, Any]):
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, cls=CustomEncoder)
+        # NOTE: Encoding in a single pass is faster than 'json.dump' which
+        # writes each chunk of the iterative encoder separately. Compact
+        # separators trim the whitespace repeated for every key and item.
+        path.write_text(
+            json.dumps(data, cls=CustomEncoder, separators=(",", ":")),
+            encoding="utf-8",
+        )
 
     def commit(self, path: Path) -> None:
         self.refresh(path)
         self.version = version
+        self.data = self.process_data(self.data)
         data = {
             "version": self.version,
-            "data": self.process_data(self.data),
+            "data": self.data,
         }
         self._save(path, data)
 
-        self.modified = path.stat().st_mtime_ns
+        self._track(path.stat())
 
     def _diff(self, comp: list[T], mtime: int) -> list[T]:
+        # NOTE: Merges in a single pass over the memory models, starting
+        # from the models on disk instead of building a union of both ids.
         old_models = {m.id: m for m in self.data}
-        new_models = {m.id: m for m in comp}
-
-        model_ids: set[int] = set(old_models)
-        model_ids.update(new_models)
+        new_data = {m.id: m for m in comp}
 
-        new_data: list[T] = []
-        for mid in model_ids:
-            old = old_models.get(mid)
-            new = new_models.get(mid)
-            if (old is None and new is not None) or (new and old and new.timestamp >= old.timestamp):
-                new_data.append(new)
-            elif old and old.timestamp.timestamp() * 10**9 >= mtime:
-                new_data.append(old)
+        for mid, old in old_models.items():
+            new = new_data.get(mid)
+            if new is not None and new.timestamp >= old.timestamp:
+                continue
+            if old.timestamp.timestamp() * 10**9 >= mtime:
+                new_data[mid] = old
+            elif new is not None:
+                del new_data[mid]
 
-        return new_data
+        return list(new_data.values())
 
     def _load(self, path: Path) -> dict[str, Any]:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f, cls=CustomDecoder)
+        return json.loads(path.read_bytes(), cls=CustomDecoder)
 
     def load(self, path: Path) -> None:
-        if path.exists():
+        stat = self._stat(path)
+        if stat is not None:
+            if self._unchanged(stat):
+                # NOTE: Memory already mirrors the file so re-parsing is skipped.
+                return
             data = self._load(path)
-            self.modified = path.stat().st_mtime_ns
+            self._track(stat)
             self.version = data["version"]
             self.data = self.process_data(data["data"])
         else:
@@ -130,8 +160,16 @@ class JSONSession(Generic[T]):
             self.modified = time.time_ns()
 
     def process_data(self, data: list[T]) -> list[T]:
-        data.sort(key=lambda x: x.timestamp or datetime.now(timezone.utc))
-        return data[: self.max_length]
+        now = datetime.now(timezone.utc)
+
+        def key(model: T) -> datetime:
+            return model.timestamp or now
+
+        if len(data) > self.max_length:
+            # NOTE: Bounded heap selection avoids sorting entries that are discarded.
+            return heapq.nsmallest(self.max_length, data, key=key)
+        data.sort(key=key)
+        return data
 
 
 class JSONCache(TogglCache, Generic[T]):
@@ -171,6 +209,13 @@ class JSONCache(TogglCache, Generic[T]):
 
     __slots__ = ("session",)
 
+    _OPERATORS: Final[dict[Comparison, Callable[[Any, Any], bool]]] = {
+        Comparison.LESS_THEN: operator.lt,
+        Comparison.LESS_THEN_OR_EQUAL: operator.le,
+        Comparison.GREATER_THEN: operator.gt,
+        Comparison.GREATER_THEN_OR_EQUAL: operator.ge,
+    }
+
     def __init__(
         self,
         path: Path | PathLike | str,
@@ -197,39 +242,51 @@ class JSONCache(TogglCache, Generic[T]):
         min_ts = datetime.now(timezone.utc) - self.expire_after
         return [m for m in self.session.data if m.timestamp >= min_ts]  # type: ignore[operator]
 
-    def find(self, entry: T | dict[str, int], **kwargs: Any) -> T | None:
-        self.session.refresh(self.cache_path)
-        if not self.session.data:
-            return None
-        for item in self.session.data:
-            if item is not None and item["id"] == entry["id"] and isinstance(item, self.model):
-                return item
+    def _find_index(self, entry: T | dict[str, int]) -> int | None:
+        model = self.model
+        entry_id = entry["id"]
+        for i, item in enumerate(self.session.data):
+            if item is not None and item["id"] == entry_id and isinstance(item, model):
+                return i
         return None
 
-    def _add_entry(self, item: T) -> None:
-        find_entry = self.find(item)
-        if find_entry is None:
-            return self.session.data.append(item)
-        index = self.session.data.index(find_entry)
-        item.timestamp = datetime.now(timezone.utc)
-        self.session.data[index] = item
-        return None
+    def find(self, entry: T | dict[str, int], **kwargs: Any) -> T | None:
+        self.session.refresh(self.cache_path)
+        index = self._find_index(entry)
+        return None if index is None else self.session.data[index]
 
     def add(self, *entries: T) -> None:
+        self.session.refresh(self.cache_path)
+        data = self.session.data
+        model = self.model
+
+        # NOTE: Existing positions are indexed once per batch instead of
+        # scanning the data for every entry.
+        indexes: dict[int, int] = {}
+        for i, item in enumerate(data):
+            if item is not None and isinstance(item, model):
+                indexes.setdefault(item.id, i)
+
+        now = datetime.now(timezone.utc)
         for entry in entries:
-            self._add_entry(entry)
+            index = indexes.get(entry.id)
+            if index is None:
+                indexes[entry.id] = len(data)
+                data.append(entry)
+            else:
+                entry.timestamp = now
+                data[index] = entry
 
     def update(self, *entries: T) -> None:
         self.add(*entries)
 
     def _delete_entry(self, entry: T) -> None:
-        find_entry = self.find(entry)
-        if not find_entry:
-            return
-        index = self.session.data.index(find_entry)
-        self.session.data.pop(index)
+        index = self._find_index(entry)
+        if index is not None:
+            self.session.data.pop(index)
 
     def delete(self, *entries: T) -> None:
+        self.session.refresh(self.cache_path)
         for entry in entries:
             self._delete_entry(entry)
 
@@ -256,13 +313,14 @@ class JSONCache(TogglCache, Generic[T]):
         self.session.load(self.cache_path)
         search = self.session.data
         existing: defaultdict[str, set[Any]] = defaultdict(set)
+        queries = tuple(map(self._hash_query, query))
 
         return [
             model
             for model in search
             if self._query_helper(
                 model,
-                query,
+                queries,
                 existing,
                 min_ts,
                 distinct=distinct,
@@ -278,49 +336,64 @@ class JSONCache(TogglCache, Generic[T]):
         *,
         distinct: bool,
     ) -> bool:
-        if self.expire_after and min_ts and model.timestamp and min_ts >= model.timestamp:
+        if min_ts and model.timestamp and min_ts >= model.timestamp:
             return False
 
         for query in queries:
             if (
-                distinct and not isinstance(query.value, list) and model[query.key] in existing[query.key]
+                distinct
+                and not isinstance(query.value, list | frozenset)
+                and getattr(model, query.key) in existing[query.key]
             ) or not self._match_query(model, query):
                 return False
 
         if distinct:
             for query in queries:
-                value = model[query.key]
+                value = getattr(model, query.key)
                 if isinstance(value, Hashable):
                     existing[query.key].add(value)
 
         return True
 
+    @staticmethod
+    def _hash_query(query: TogglQuery) -> TogglQuery:
+        # NOTE: Hashable list values are converted into a set once per query
+        # call, so each model is matched with a lookup instead of a scan.
+        if (
+            query.comparison == Comparison.EQUAL
+            and isinstance(query.value, list)
+            and all(isinstance(v, Hashable) for v in query.value)
+        ):
+            return replace(query, value=frozenset(query.value))
+        return query
+
     @staticmethod
     def _match_equal(model: T, query: TogglQuery) -> bool:
+        if isinstance(query.value, frozenset):
+            value = getattr(model, query.key)
+            if isinstance(value, Sequence) and not isinstance(value, str):
+                return any(v in query.value for v in value if isinstance(v, Hashable))
+            return isinstance(value, Hashable) and value in query.value
+
         if isinstance(query.value, Sequence) and not isinstance(query.value, str):
-            value = model[query.key]
+            value = getattr(model, query.key)
 
             if isinstance(value, Sequence) and not isinstance(value, str):
                 return any(v == comp for comp in query.value for v in value)
 
             return any(value == comp for comp in query.value)
 
-        return model[query.key] == query.value
+        return getattr(model, query.key) == query.value
 
     @staticmethod
     def _match_query(model: T, query: TogglQuery) -> bool:
         if query.comparison == Comparison.EQUAL:
             return JSONCache._match_equal(model, query)
-        if query.comparison == Comparison.LESS_THEN:
-            return model[query.key] < query.value
-        if query.comparison == Comparison.LESS_THEN_OR_EQUAL:
-            return model[query.key] <= query.value
-        if query.comparison == Comparison.GREATER_THEN:
-            return model[query.key] > query.value
-        if query.comparison == Comparison.GREATER_THEN_OR_EQUAL:
-            return model[query.key] >= query.value
-        msg = f"{query.comparison} is not implemented!"
-        raise NotImplementedError(msg)
+        compare = JSONCache._OPERATORS.get(query.comparison)
+        if compare is None:
+            msg = f"{query.comparison} is not implemented!"
+            raise NotImplementedError(msg)
+        return compare(getattr(model, query.key), query.value)
 
     @property
     def cache_path(self) -> Path:
@@ -363,22 +436,31 @@ class CustomDecoder(json.decoder.JSONDecoder):
         TogglWorkspace.__tablename__: TogglWorkspace,
     }
 
-    def decode(self, obj: Any) -> Any:  # type: ignore[override]
-        if obj and isinstance(obj, str):
-            with contextlib.suppress(json.decoder.JSONDecodeError):
-                obj = super().decode(obj)
+    # NOTE: Only fields with few distinct values are interned, as interned
+    # strings may never be freed. Tag names are handled separately because
+    # the 'name' of other models such as tracker descriptions is free text.
+    INTERN_KEYS: Final[tuple[str, ...]] = ("color",)
 
-        if isinstance(obj, dict):
-            if "timestamp" in obj and isinstance(obj["timestamp"], str):
-                obj["timestamp"] = parse_iso(obj["timestamp"])
-            for k, v in obj.items():
-                obj[k] = self.decode(v)
-            if "class" in obj:
-                cls: str = obj.pop("class")
-                obj = self.MATCH_DICT[cls].from_kwargs(**obj)
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("object_hook", self._object_hook)
+        super().__init__(*args, **kwargs)
 
-        elif isinstance(obj, list):
-            for i, v in enumerate(obj):
-                obj[i] = self.decode(v)
+    @classmethod
+    def _object_hook(cls, obj: dict[str, Any]) -> Any:
+        """Converts each decoded object inline with the parser.
 
+        Nested objects are decoded first, so any child models are already
+        converted when the parent is constructed.
+        """
+        if "timestamp" in obj and isinstance(obj["timestamp"], str):
+            obj["timestamp"] = parse_iso(obj["timestamp"])
+        for key in cls.INTERN_KEYS:
+            value = obj.get(key)
+            if isinstance(value, str):
+                obj[key] = sys.intern(value)
+        if obj.get("class") == TogglTag.__tablename__ and isinstance(obj.get("name"), str):
+            obj["name"] = sys.intern(obj["name"])
+        if "class" in obj:
+            model: str = obj.pop("class")
+            return cls.MATCH_DICT[model].from_kwargs(**obj)
         return obj
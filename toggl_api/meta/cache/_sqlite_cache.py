@@ -3,11 +3,12 @@
 
 from __future__ import annotations
 
-import atexit
+import operator
 import warnings
+import weakref
 from datetime import datetime, timedelta, timezone
 from os import PathLike
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Final, TypeVar
 
 try:
     import sqlalchemy as db
@@ -16,7 +17,6 @@ try:
 except ImportError:
     pass
 
-import contextlib
 from collections.abc import Sequence
 
 from toggl_api._utility import _requires
@@ -26,6 +26,7 @@ from toggl_api.models._schema import register_tables
 from ._base_cache import Comparison, TogglCache, TogglQuery
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
     from os import PathLike
     from pathlib import Path
 
@@ -35,6 +36,16 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound=TogglClass)
 
 
+def _set_pragmas(dbapi_connection: Any, _: Any) -> None:
+    # NOTE: WAL lets readers proceed during writes and with 'NORMAL' syncing
+    # each commit no longer waits on a full fsync.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 @_requires("sqlalchemy")
 class SqliteCache(TogglCache[T]):
     """Class for caching data to a SQLite database.
@@ -51,7 +62,8 @@ class SqliteCache(TogglCache[T]):
             automatically when supplied to a cached endpoint.
         engine: Supply an existing database engine or otherwise one is created.
             This may be used to supply an entirely different DB, but SQLite is
-            the one that is tested & supported.
+            the one that is tested & supported. Created engines use the WAL
+            journal mode.
 
     Attributes:
         expire_after: Time after which the cache should be refreshed.
@@ -65,7 +77,15 @@ class SqliteCache(TogglCache[T]):
         query: Querying method that uses SQL to query cached objects.
     """
 
-    __slots__ = ("database", "metadata", "session")
+    __slots__ = ("__weakref__", "database", "metadata", "session")
+
+    _OPERATORS: Final[dict[Comparison, Callable[[Any, Any], Any]]] = {
+        Comparison.EQUAL: operator.eq,
+        Comparison.LESS_THEN: operator.lt,
+        Comparison.LESS_THEN_OR_EQUAL: operator.le,
+        Comparison.GREATER_THEN: operator.gt,
+        Comparison.GREATER_THEN_OR_EQUAL: operator.ge,
+    }
 
     def __init__(
         self,
@@ -76,52 +96,65 @@ class SqliteCache(TogglCache[T]):
         engine: Engine | None = None,
     ) -> None:
         super().__init__(path, expire_after, parent)
-        self.database = engine or db.create_engine(f"sqlite:///{self.cache_path}")
+        if engine is None:
+            engine = db.create_engine(f"sqlite:///{self.cache_path}")
+            db.event.listen(engine, "connect", _set_pragmas)
+        self.database = engine
         self.metadata = register_tables(self.database)
 
         self.session = Session(self.database)
-        atexit.register(self.session.close)
+        # NOTE: Closes the session once the cache is collected or at exit,
+        # without the finalizer keeping the cache itself alive.
+        weakref.finalize(self, self.session.close)
 
     def commit(self) -> None:
         self.session.commit()
 
+    def _rollback(self) -> None:
+        self.session.rollback()
+
     def load(self) -> Query[T]:
-        query = self.session.query(self.model)
-        if self.expire_after is not None:
-            min_ts = datetime.now(timezone.utc) - self.expire_after
-            query.filter(self.model.timestamp > min_ts)  # type: ignore[arg-type]
-        return query
+        return self._filter_expired(self.session.query(self.model))
 
     def add(self, *entries: T) -> None:
+        # NOTE: Existing rows are looked up with a single query for the whole
+        # batch instead of a query per entry.
+        ids = [item.id for item in entries]
+        statement = db.select(self.model.id).where(self.model.id.in_(ids))  # type: ignore[attr-defined,call-overload,misc]
+        existing: set[int] = set(self.session.scalars(statement))
         for item in entries:
-            if self.find(item):
-                self.update(item)
+            if item.id in existing:
+                self.session.merge(item)
                 continue
             self.session.add(item)
-        self.commit()
+            existing.add(item.id)
+        self._commit_or_defer()
 
     def update(self, *entries: T) -> None:
         for item in entries:
             self.session.merge(item)
-        self.commit()
+        self._commit_or_defer()
 
     def delete(self, *entries: T) -> None:
-        for entry in entries:
-            if self.find(entry):
-                self.session.query(
-                    self.model,
-                ).filter_by(id=entry.id).delete()
-        self.commit()
+        ids = [entry.id for entry in entries]
+        self.session.query(self.model).filter(self.model.id.in_(ids)).delete()  # type: ignore[attr-defined,misc]
+        self._commit_or_defer()
 
     def find(self, query: T | dict[str, Any]) -> T | None:
         if isinstance(query, TogglClass):
             query = {"id": query.id}
 
-        search = self.session.query(self.model)
-        if self._expire_after is not None:
-            min_ts = datetime.now(timezone.utc) - self._expire_after
-            search = search.filter(self.model.timestamp > min_ts)  # type: ignore[arg-type]
-        return search.filter_by(**query).first()
+        if query.keys() == {"id"}:
+            # NOTE: Primary key lookups are served from the identity map when
+            # the model is already loaded in the session.
+            model = self.session.get(self.model, query["id"])
+            if model is None or (
+                self._expire_after is not None and model.timestamp <= datetime.now(timezone.utc) - self._expire_after
+            ):
+                return None
+            return model
+
+        return self._filter_expired(self.session.query(self.model)).filter_by(**query).first()
 
     def query(self, *query: TogglQuery, distinct: bool = False) -> Query[T]:
         """Query method for filtering models from cache.
@@ -139,12 +172,7 @@ class SqliteCache(TogglCache[T]):
             A SQLAlchemy query object with parameters filtered.
         """
 
-        search = self.session.query(self.model)
-        if isinstance(self.expire_after, timedelta):
-            min_ts = datetime.now(timezone.utc) - self.expire_after
-            search = search.filter(self.model.timestamp > min_ts)  # type: ignore[arg-type]
-
-        search = self._query_helper(list(query), search)
+        search = self._query_helper(query, self._filter_expired(self.session.query(self.model)))
         if distinct:
             data = [q.key for q in query]
             with warnings.catch_warnings():
@@ -152,33 +180,34 @@ class SqliteCache(TogglCache[T]):
                 search = search.distinct(*data).group_by(*data)  # type: ignore[arg-type]
         return search
 
-    def _query_helper(self, query: list[TogglQuery], query_obj: Query[T]) -> Query[T]:
-        if query:
-            query_obj = self._match_query(query.pop(0), query_obj)
-            return self._query_helper(query, query_obj)
+    def _filter_expired(self, query_obj: Query[T]) -> Query[T]:
+        # NOTE: The cutoff is computed once per public call and bound as a
+        # parameter, so the compiled statement is reused between calls.
+        if self._expire_after is None:
+            return query_obj
+        min_ts = datetime.now(timezone.utc) - self._expire_after
+        return query_obj.filter(self.model.timestamp > min_ts)  # type: ignore[arg-type]
+
+    def _query_helper(self, query: Iterable[TogglQuery], query_obj: Query[T]) -> Query[T]:
+        for q in query:
+            query_obj = self._match_query(q, query_obj)
         return query_obj
 
     def _match_query(self, query: TogglQuery, query_obj: Query[T]) -> Query[T]:
         value = getattr(self.model, query.key)  # type: ignore[union-attr]
-        if query.comparison == Comparison.EQUAL:
-            if isinstance(query.value, Sequence) and not isinstance(query.value, str):
-                return query_obj.filter(value.in_(query.value))
-            return query_obj.filter(value == query.value)
-        if query.comparison == Comparison.LESS_THEN:
-            return query_obj.filter(value < query.value)
-        if query.comparison == Comparison.LESS_THEN_OR_EQUAL:
-            return query_obj.filter(value <= query.value)
-        if query.comparison == Comparison.GREATER_THEN:
-            return query_obj.filter(value > query.value)
-        if query.comparison == Comparison.GREATER_THEN_OR_EQUAL:
-            return query_obj.filter(value >= query.value)
-        msg = f"{query.comparison} is not implemented!"
-        raise NotImplementedError(msg)
+        if (
+            query.comparison == Comparison.EQUAL
+            and isinstance(query.value, Sequence)
+            and not isinstance(query.value, str)
+        ):
+            return query_obj.filter(value.in_(query.value))
+
+        compare = self._OPERATORS.get(query.comparison)
+        if compare is None:
+            msg = f"{query.comparison} is not implemented!"
+            raise NotImplementedError(msg)
+        return query_obj.filter(compare(value, query.value))
 
     @property
     def cache_path(self) -> Path:
         return super().cache_path / "cache.sqlite"
-
-    def __del__(self) -> None:
-        with contextlib.suppress(AttributeError, TypeError):
-            self.session.close()
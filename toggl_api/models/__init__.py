@@ -1,3 +1,4 @@
+import functools
 from dataclasses import fields
 from typing import Any
 
@@ -14,18 +15,23 @@ from ._models import (
 from ._schema import register_tables
 
 
+@functools.cache
+def _field_names(cls: type[TogglClass]) -> tuple[str, ...]:
+    return tuple(field.name for field in fields(cls))
+
+
 def as_dict_custom(obj: TogglClass) -> dict[str, Any]:
     data: dict[str, Any] = {"class": obj.__tablename__}
 
-    for field in fields(obj):
-        field_data = getattr(obj, field.name)
+    for name in _field_names(type(obj)):
+        field_data = getattr(obj, name)
 
-        if isinstance(field_data, TogglClass):
-            data[field.name] = as_dict_custom(field_data)
-        elif isinstance(field_data, list):
-            data[field.name] = [as_dict_custom(item) for item in field_data]
+        if isinstance(field_data, list):
+            data[name] = [as_dict_custom(item) for item in field_data]
+        elif isinstance(field_data, TogglClass):
+            data[name] = as_dict_custom(field_data)
         else:
-            data[field.name] = field_data
+            data[name] = field_data
 
     return data
 
@@ -42,7 +42,12 @@ class TogglClass(ABC):
         elif self.timestamp is None:
             self.timestamp = datetime.now(tz=timezone.utc)
 
-        self.timestamp = self.timestamp.replace(tzinfo=timezone.utc)
+        # NOTE: Aware timestamps are converted instead of relabelled and UTC
+        # timestamps are left as is.
+        if self.timestamp.tzinfo is None:
+            self.timestamp = self.timestamp.replace(tzinfo=timezone.utc)
+        elif self.timestamp.tzinfo is not timezone.utc:
+            self.timestamp = self.timestamp.astimezone(timezone.utc)
 
     @classmethod
     @abstractmethod
@@ -343,7 +348,7 @@ class TogglTracker(WorkspaceChild):
             stop=kwargs.get("stop"),
             project=kwargs.get("project_id", kwargs.get("project")),
             tags=TogglTracker.get_tags(**kwargs),
-            timestamp=kwargs.get("timestamp", datetime.now(tz=timezone.utc)),
+            timestamp=kwargs.get("timestamp") or datetime.now(tz=timezone.utc),
         )
 
     @staticmethod
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+import weakref
 from typing import TYPE_CHECKING
 
 with contextlib.suppress(ImportError):
-    from sqlalchemy import Boolean, Column, Date, ForeignKey, Integer, Interval, MetaData, String, Table
-    from sqlalchemy.exc import ArgumentError
+    from sqlalchemy import Boolean, Column, Date, ForeignKey, Index, Integer, Interval, MetaData, String, Table
     from sqlalchemy.orm import registry, relationship
     from sqlalchemy.sql import func
 
@@ -24,56 +25,50 @@ if TYPE_CHECKING:
     from sqlalchemy.engine import Engine
 
 
+# NOTE: Engines which already had the schema created. Models can only be mapped
+# once per process so the metadata itself is cached by '_get_metadata'.
+_CREATED: weakref.WeakSet[Engine] = weakref.WeakSet()
+
+
 @_requires("sqlalchemy")
-def _create_mappings(metadata: MetaData) -> None:
-    organization = Table(
-        "organization",
-        metadata,
-        Column(
-            "created",
-            UTCDateTime(timezone=True),
-            server_default=func.now(),
-        ),
-        Column("timestamp", UTCDateTime(timezone=True)),
+def _base_columns() -> list[Column]:
+    # NOTE: Columns shared by every model table. Built per table as columns
+    # can only belong to a single table.
+    return [
+        Column("created", UTCDateTime(timezone=True), server_default=func.now()),
+        Column("timestamp", UTCDateTime(timezone=True), index=True),
         Column("id", Integer, primary_key=True),
         Column("name", String(255)),
-    )
-    _map_imperatively(TogglOrganization, metadata, organization)
+    ]
+
+
+@_requires("sqlalchemy")
+def _create_mappings(metadata: MetaData) -> None:
+    mapper_registry = registry(metadata=metadata)
+
+    organization = Table("organization", metadata, *_base_columns())
+    _map_imperatively(TogglOrganization, mapper_registry, organization)
 
     workspace = Table(
         "workspace",
         metadata,
-        Column(
-            "created",
-            UTCDateTime(timezone=True),
-            server_default=func.now(),
-        ),
-        Column("timestamp", UTCDateTime(timezone=True)),
-        Column("id", Integer, primary_key=True),
-        Column("name", String(255)),
+        *_base_columns(),
         Column("organization", Integer),
     )
-
-    _map_imperatively(TogglWorkspace, metadata, workspace)
+    _map_imperatively(TogglWorkspace, mapper_registry, workspace)
 
     client = Table(
         "client",
         metadata,
-        Column("created", UTCDateTime(timezone=True), server_default=func.now()),
-        Column("timestamp", UTCDateTime),
-        Column("id", Integer, primary_key=True),
-        Column("name", String(255)),
+        *_base_columns(),
         Column("workspace", Integer, ForeignKey("workspace.id")),
     )
-    _map_imperatively(TogglClient, metadata, client)
+    _map_imperatively(TogglClient, mapper_registry, client)
 
     project = Table(
         "project",
         metadata,
-        Column("created", UTCDateTime, server_default=func.now()),
-        Column("timestamp", UTCDateTime),
-        Column("id", Integer, primary_key=True),
-        Column("name", String(255)),
+        *_base_columns(),
         Column("workspace", Integer, ForeignKey("workspace.id")),
         Column("color", String(6)),
         Column("client", Integer, ForeignKey("client.id")),
@@ -81,32 +76,29 @@ def _create_mappings(metadata: MetaData) -> None:
         Column("start_date", Date),
         Column("stop_date", Date),
     )
-    _map_imperatively(TogglProject, metadata, project)
+    _map_imperatively(TogglProject, mapper_registry, project)
 
     tag = Table(
         "tag",
         metadata,
-        Column("created", UTCDateTime, server_default=func.now()),
-        Column("timestamp", UTCDateTime),
-        Column("id", Integer, primary_key=True),
-        Column("name", String(255)),
+        *_base_columns(),
         Column("workspace", Integer, ForeignKey("workspace.id")),
     )
-    _map_imperatively(TogglTag, metadata, tag)
+    _map_imperatively(TogglTag, mapper_registry, tag)
 
     tracker = Table(
         "tracker",
         metadata,
-        Column("created", UTCDateTime, server_default=func.now()),
-        Column("timestamp", UTCDateTime),
-        Column("id", Integer, primary_key=True),
-        Column("name", String(255)),
+        *_base_columns(),
         Column("workspace", Integer, ForeignKey("workspace.id")),
-        Column("start", UTCDateTime),
+        Column("start", UTCDateTime, index=True),
         Column("duration", Interval, nullable=True),
         Column("stop", UTCDateTime, nullable=True),
         Column("project", Integer, ForeignKey("project.id"), nullable=True),
     )
+    # NOTE: Only running trackers are looked up by a missing stop time so the
+    # index is kept partial.
+    Index("ix_tracker_running", tracker.c.stop, sqlite_where=tracker.c.stop.is_(None))
 
     tracker_tag = Table(
         "tracker_tag",
@@ -116,19 +108,28 @@ def _create_mappings(metadata: MetaData) -> None:
     )
     _map_imperatively(
         TogglTracker,
-        metadata,
+        mapper_registry,
         tracker,
-        properties={"tags": relationship(TogglTag, secondary=tracker_tag)},
+        # NOTE: Tags are fetched with a single IN query for all loaded trackers.
+        properties={"tags": relationship(TogglTag, secondary=tracker_tag, lazy="selectin")},
     )
 
 
 @_requires("sqlalchemy")
-def register_tables(engine: Engine) -> MetaData:
+@functools.cache
+def _get_metadata() -> MetaData:
     metadata = MetaData()
-
     _create_mappings(metadata)
+    return metadata
+
 
-    metadata.create_all(engine)
+@_requires("sqlalchemy")
+def register_tables(engine: Engine) -> MetaData:
+    metadata = _get_metadata()
+
+    if engine not in _CREATED:
+        metadata.create_all(engine)
+        _CREATED.add(engine)
 
     return metadata
 
@@ -136,11 +137,9 @@ def register_tables(engine: Engine) -> MetaData:
 @_requires("sqlalchemy")
 def _map_imperatively(
     cls: type,
-    metadata: MetaData,
+    mapper_registry: registry,
     table: Table,
     properties: dict | None = None,
 ) -> None:
-    mapper_registry = registry(metadata=metadata)
     properties = properties or {}
-    with contextlib.suppress(ArgumentError):
-        mapper_registry.map_imperatively(cls, table, properties=properties)
+    mapper_registry.map_imperatively(cls, table, properties=properties)
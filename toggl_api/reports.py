@@ -3,7 +3,7 @@
 from abc import abstractmethod
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Any, ClassVar, Generic, Literal, TypeVar, cast
+from typing import Any, ClassVar, Final, Generic, Literal, TypeVar, cast, get_args
 
 from httpx import BasicAuth, Client, Response, Timeout
 
@@ -12,12 +12,13 @@ from .meta import BaseBody, RequestMethod, TogglEndpoint
 from .models import TogglProject, TogglWorkspace
 
 REPORT_FORMATS = Literal["pdf", "csv"]
+_REPORT_EXTENSIONS: Final[frozenset[str]] = frozenset(get_args(REPORT_FORMATS))
 
 
 T = TypeVar("T")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PaginationOptions:
     """Dataclass for paginate endpoints."""
 
@@ -26,7 +27,10 @@ class PaginationOptions:
     next_row: int | None = field(default=None)
 
 
-@dataclass
+_DEFAULT_PAGINATION: Final[PaginationOptions] = PaginationOptions()
+
+
+@dataclass(slots=True)
 class PaginatedResult(Generic[T]):
     """Generic dataclass for paginated results."""
 
@@ -50,11 +54,11 @@ class InvalidExtensionError(ValueError):
 
 
 def _validate_extension(extension: REPORT_FORMATS) -> None:
-    if extension not in {"pdf", "csv"}:
+    if extension not in _REPORT_EXTENSIONS:
         raise InvalidExtensionError
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportBody(BaseBody):
     """Body for summary endpoint which turns into a JSON body."""
 
@@ -253,6 +257,8 @@ class ReportBody(BaseBody):
     """It will force the detailed report to return as much information as possible, as it does for the export."""
 
     def format(self, endpoint: str, **body: Any) -> dict[str, Any]:  # noqa: PLR0912
+        # NOTE: Endpoint specific parameters are resolved once per endpoint.
+        parameters = self._endpoint_parameters(endpoint)
         body.update(
             {
                 "client_ids": self.client_ids,
@@ -272,13 +278,13 @@ class ReportBody(BaseBody):
         if self.end_date:
             body["end_date"] = format_iso(self.end_date)
 
-        if self._verify_endpoint_parameter("date_format", endpoint):
+        if "date_format" in parameters:
             body["date_format"] = self.date_format
 
-        if self._verify_endpoint_parameter("duration_format", endpoint):
+        if "duration_format" in parameters:
             body["duration_format"] = self.duration_format
 
-        if self.include_time_entry_ids and self._verify_endpoint_parameter("include_time_entry_ids", endpoint):
+        if self.include_time_entry_ids and "include_time_entry_ids" in parameters:
             body["include_time_entry_ids"] = self.include_time_entry_ids
 
         if self.description is not None:
@@ -287,10 +293,10 @@ class ReportBody(BaseBody):
         if self.group_ids:
             body["group_ids"] = self.group_ids
 
-        if self.grouping and self._verify_endpoint_parameter("grouping", endpoint):
+        if self.grouping and "grouping" in parameters:
             body["grouping"] = self.grouping
 
-        if self.grouped and self._verify_endpoint_parameter("grouped", endpoint):
+        if self.grouped and "grouped" in parameters:
             body["grouped"] = self.grouped
 
         if isinstance(self.max_duration_seconds, int):
@@ -305,19 +311,19 @@ class ReportBody(BaseBody):
         if isinstance(self.rounding_minutes, int):
             body["rounding_minutes"] = self.rounding_minutes
 
-        if self.sub_grouping is not None and self._verify_endpoint_parameter("sub_grouping", endpoint):
+        if self.sub_grouping is not None and "sub_grouping" in parameters:
             body["sub_grouping"] = self.sub_grouping
 
-        if self.order_by is not None and self._verify_endpoint_parameter("order_by", endpoint):
+        if self.order_by is not None and "order_by" in parameters:
             body["order_by"] = self.order_by
 
-        if self.order_dir is not None and self._verify_endpoint_parameter("order_dir", endpoint):
+        if self.order_dir is not None and "order_dir" in parameters:
             body["order_dir"] = self.order_dir
 
-        if self.resolution is not None and self._verify_endpoint_parameter("resolution", endpoint):
+        if self.resolution is not None and "resolution" in parameters:
             body["resolution"] = self.resolution
 
-        if self.enrich_response and self._verify_endpoint_parameter("enrich_response", endpoint):
+        if self.enrich_response and "enrich_response" in parameters:
             body["enrich_response"] = self.enrich_response
 
         return body
@@ -526,7 +532,7 @@ class DetailedReportEndpoint(ReportEndpoint):
             Data with pagination information if required.
         """
 
-        pagination = pagination or PaginationOptions()
+        pagination = pagination or _DEFAULT_PAGINATION
 
         request: Response = cast(
             Response,
@@ -574,7 +580,7 @@ class DetailedReportEndpoint(ReportEndpoint):
         """
         _validate_extension(extension)
 
-        pagination = pagination or PaginationOptions()
+        pagination = pagination or _DEFAULT_PAGINATION
         request = cast(
             Response,
             self.request(